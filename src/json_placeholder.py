@@ -1,22 +1,139 @@
+import aiohttp
+import asyncio
+import functools
+import json
+import random
 import requests
+from requests.adapters import HTTPAdapter
 import time
 from datetime import datetime, timezone
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 logger = logging.getLogger(__name__)
 
+JSON_CONTENT_HEADERS = {'Content-type': 'application/json; charset=UTF-8'}
+
+TRANSIENT_STATUS_CODES = {429, 502, 503, 504}
+
+
+class TransientHTTPError(requests.HTTPError):
+    """
+    HTTPError raised for status codes worth retrying (429 and the 5xx gateway errors).
+    May carry a retry_after hint (in seconds) parsed from the server's Retry-After header.
+    """
+    retry_after = None
+
+
+TRANSIENT_EXCEPTIONS = (requests.ConnectionError, requests.Timeout, TransientHTTPError)
+
+if httpx is not None:
+    HTTPX_TRANSIENT_EXCEPTIONS = (httpx.ConnectError, httpx.TimeoutException, TransientHTTPError)
+    HTTP_ERRORS = (requests.HTTPError, httpx.HTTPError)
+    ASYNC_HTTP_ERRORS = (aiohttp.ClientError, httpx.HTTPError)
+else:
+    HTTPX_TRANSIENT_EXCEPTIONS = (TransientHTTPError,)
+    HTTP_ERRORS = (requests.HTTPError,)
+    ASYNC_HTTP_ERRORS = (aiohttp.ClientError,)
 
-def retry(exception_list, total_tries=5, initial_wait=.5, backoff_factor=2, logger=None):
+
+def _response_json(response: requests.models.Response) -> dict:
+    """
+    Decodes a response body as json. Uses orjson when installed (C parser with SIMD UTF-8
+    validation, and skips requests' encoding guesswork), falling back to Response.json.
+
+    :param response: (requests.Response) The response whose body will be decoded.
+    :return: (dict) The decoded json body.
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _dumps(obj) -> bytes:
+    """
+    Serializes an object to json bytes, using orjson when installed and stdlib json otherwise.
+
+    :param obj: The object to serialize.
+    :return: (bytes) The serialized json.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+@functools.lru_cache(maxsize=128)
+def _serialize_items(items: tuple) -> bytes:
+    return _dumps(dict(items))
+
+
+def _serialize_body(body: dict) -> bytes:
+    """
+    Serializes a request body to json bytes, caching identical flat bodies so hot loops
+    POSTing the same payload skip re-serialization. Bodies with unhashable values (nested
+    dicts/lists) are serialized directly.
+
+    :param body: (dict) The request body to serialize.
+    :return: (bytes) The serialized json body.
+    """
+    try:
+        return _serialize_items(tuple(sorted(body.items())))
+    except TypeError:
+        return _dumps(body)
+
+
+def _raise_for_status(response: requests.models.Response) -> requests.models.Response:
+    """
+    Like Response.raise_for_status, but re-raises transient status codes as TransientHTTPError
+    so the retry decorator only retries errors that can plausibly succeed on a later try.
+
+    :param response: (requests.Response) The response to check.
+    :return: (requests.Response) The response unchanged when its status code is not an error.
+    """
+    try:
+        response.raise_for_status()
+    except requests.HTTPError as err:
+        if response.status_code in TRANSIENT_STATUS_CODES:
+            transient = TransientHTTPError(*err.args, response=response)
+            retry_after = response.headers.get('Retry-After')
+            if retry_after is not None:
+                try:
+                    transient.retry_after = float(retry_after)
+                except ValueError:
+                    pass
+            raise transient from None
+        raise
+    return response
+
+
+def retry(exception_list, total_tries=5, initial_wait=.5, backoff_factor=2, max_delay=30,
+          jitter='full', rng=None, logger=None):
     """
     Allows for retry of a function. User can specify total tries, wait time, how quickly wait time increases.
+    The wait between tries is jittered so many clients retrying a degraded server do not all
+    wake at the same moment and re-create the outage.
 
     :param exception_list: (list<Exception) Which Exceptions user wants to handle as part of the retry logic.
     :param total_tries: (int) The total number of tries the retry decorator will attempt.
     :param initial_wait: (float) The time (in seconds) that the retry decorator will wait as a baseline before retrying.
     :param backoff_factor: (int) The speed at which the delay increases.
+    :param max_delay: (float) The cap (in seconds) on the backoff delay between tries.
+    :param jitter: (str) Jitter strategy: 'full' sleeps uniform(0, delay), 'equal' sleeps
+    delay/2 + uniform(0, delay/2), 'none' sleeps the full delay.
+    :param rng: (random.Random) Optional random source so tests can seed deterministically.
     :param logger: (logging.Logger) The logger that will record failures on retries and their error Types.
     :return:
     """
+    rng = rng or random
     def retry_decorator(func):
         def func_with_retry(*args, **kwargs):
             retries, delay = total_tries, initial_wait
@@ -26,12 +143,21 @@ def retry(exception_list, total_tries=5, initial_wait=.5, backoff_factor=2, logg
                 except exception_list as exception:
                     retries -= 1
                     if retries == 0:
-                        logger.error(f'Function: {func.__name__} failed after {total_tries} attempts.\n')
+                        logger.error('Function: %s failed after %s attempts.\n', func.__name__, total_tries)
                         raise
-                    logger.warning(f'Function: {func.__name__} failed with exception: {exception}.\n'
-                                   f'Retrying in {delay} seconds.\n')
-                    time.sleep(delay)
-                    delay *= backoff_factor
+                    retry_after = getattr(exception, 'retry_after', None)
+                    if retry_after is not None:
+                        sleep_for = retry_after
+                    elif jitter == 'full':
+                        sleep_for = rng.uniform(0, delay)
+                    elif jitter == 'equal':
+                        sleep_for = delay / 2 + rng.uniform(0, delay / 2)
+                    else:
+                        sleep_for = delay
+                    logger.warning('Function: %s failed with exception: %s.\nRetrying in %s seconds.\n',
+                                   func.__name__, exception, sleep_for)
+                    time.sleep(sleep_for)
+                    delay = min(delay * backoff_factor, max_delay)
 
         return func_with_retry
 
@@ -40,7 +166,8 @@ def retry(exception_list, total_tries=5, initial_wait=.5, backoff_factor=2, logg
 
 class RequestApi:
     """
-    Basic request API class featuring retries on HTTPErrors (status codes >= 400). Takes a
+    Basic request API class featuring retries on transient failures (connection errors,
+    timeouts, and 429/502/503/504 responses; other HTTPErrors raise immediately). Takes a
     base API url and works off of paths for each request made. Supports GET/POST/PUT/PATCH/DELETE.
 
     All functions support the same arguments:
@@ -52,59 +179,299 @@ class RequestApi:
     """
     def __init__(self, base_url: str):
         self.base_url = base_url
+        self._base = base_url.rstrip('/')
+        self.session = requests.Session()
+        # Sized for bursts of concurrent callers; the default pool of 10 evicts
+        # keep-alive connections under load, forcing fresh TCP/TLS handshakes.
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, pool_block=False)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({'Connection': 'keep-alive', 'Accept-Encoding': 'gzip'})
 
-    @retry(Exception, total_tries=2, logger=logger)
-    def get(self, api_path: str, payload: dict = None, headers: dict = None) -> requests.models.Response:
-        response = requests.get(f'{self.base_url}{api_path}', json=payload, headers=headers)
-        try:
+    def close(self):
+        """
+        Closes the underlying session and its pooled connections.
+        """
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @retry(TRANSIENT_EXCEPTIONS, total_tries=3, logger=logger)
+    def _request(self, method: str, api_path: str, payload: dict = None, headers: dict = None,
+                 data: bytes = None) -> requests.models.Response:
+        response = self.session.request(method, self._base + api_path, json=payload, data=data, headers=headers)
+        return _raise_for_status(response)
+
+    def get(self, api_path: str, payload: dict = None, headers: dict = None,
+               data: bytes = None) -> requests.models.Response:
+        return self._request('GET', api_path, payload=payload, headers=headers, data=data)
+
+    def post(self, api_path: str, payload: dict = None, headers: dict = None,
+                data: bytes = None) -> requests.models.Response:
+        return self._request('POST', api_path, payload=payload, headers=headers, data=data)
+
+    def put(self, api_path: str, payload: dict = None, headers: dict = None,
+               data: bytes = None) -> requests.models.Response:
+        return self._request('PUT', api_path, payload=payload, headers=headers, data=data)
+
+    def patch(self, api_path: str, payload: dict = None, headers: dict = None,
+                 data: bytes = None) -> requests.models.Response:
+        return self._request('PATCH', api_path, payload=payload, headers=headers, data=data)
+
+    def delete(self, api_path: str, payload: dict = None, headers: dict = None,
+                  data: bytes = None) -> requests.models.Response:
+        return self._request('DELETE', api_path, payload=payload, headers=headers, data=data)
+
+
+class AsyncRequestApi:
+    """
+    Async counterpart to RequestApi backed by aiohttp. Takes a base API url and works off of
+    paths for each request made. Supports GET/POST/PUT/PATCH/DELETE. Independent requests can
+    be issued concurrently (e.g. via asyncio.gather) so N calls cost roughly one round-trip.
+    Concurrent identical GETs are collapsed into a single in-flight request (single-flight),
+    the standard cache-stampede mitigation.
+
+    All functions support the same arguments:
+    :param api_path: (str) The path along the base URL that will be the endpoint hit.
+    :param payload: (dict) The json payload or body for a request that needs it.
+    :param headers: (dict) Any required headers for the request.
+    :return: (dict) The decoded json body on successful request. Raises on HTTP errors.
+    """
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+        self._session = None
+        self._inflight = {}
+        self._inflight_lock = asyncio.Lock()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                base_url=self.base_url,
+                connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=30)
+            )
+        return self._session
+
+    async def close(self):
+        """
+        Closes the underlying session and its pooled connections.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _request(self, method: str, api_path: str, payload: dict = None, headers: dict = None) -> dict:
+        async with self._get_session().request(method, api_path, json=payload, headers=headers) as response:
             response.raise_for_status()
-            return response
-        except requests.HTTPError:
-            raise
+            return await response.json()
 
-    @retry(Exception, total_tries=2, logger=logger)
-    def post(self, api_path: str, payload: dict = None, headers: dict = None) -> requests.models.Response:
-        response = requests.post(f'{self.base_url}{api_path}', json=payload, headers=headers)
+    async def get(self, api_path: str, payload: dict = None, headers: dict = None) -> dict:
+        # Only plain GETs are deduplicated; payload/headers could change the response.
+        if payload is not None or headers is not None:
+            return await self._request('GET', api_path, payload=payload, headers=headers)
+        async with self._inflight_lock:
+            future = self._inflight.get(api_path)
+            if future is not None:
+                owner = False
+            else:
+                future = asyncio.get_running_loop().create_future()
+                self._inflight[api_path] = future
+                owner = True
+        if not owner:
+            return await future
         try:
-            response.raise_for_status()
-            return response
-        except requests.HTTPError:
+            result = await self._request('GET', api_path)
+        except BaseException as err:
+            future.set_exception(err)
+            # Mark retrieved so a lone caller does not trigger the unretrieved-exception warning.
+            future.exception()
             raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            async with self._inflight_lock:
+                self._inflight.pop(api_path, None)
+
+    async def post(self, api_path: str, payload: dict = None, headers: dict = None) -> dict:
+        return await self._request('POST', api_path, payload=payload, headers=headers)
 
-    @retry(Exception, total_tries=2, logger=logger)
-    def put(self, api_path: str, payload: dict = None, headers: dict = None) -> requests.models.Response:
-        response = requests.put(f'{self.base_url}{api_path}', json=payload, headers=headers)
+    async def put(self, api_path: str, payload: dict = None, headers: dict = None) -> dict:
+        return await self._request('PUT', api_path, payload=payload, headers=headers)
+
+    async def patch(self, api_path: str, payload: dict = None, headers: dict = None) -> dict:
+        return await self._request('PATCH', api_path, payload=payload, headers=headers)
+
+    async def delete(self, api_path: str, payload: dict = None, headers: dict = None) -> dict:
+        return await self._request('DELETE', api_path, payload=payload, headers=headers)
+
+
+class HttpxRequestApi:
+    """
+    Drop-in alternative to RequestApi backed by httpx. Negotiates HTTP/2 when the 'h2' extra
+    is installed and the server supports it, so concurrent requests multiplex over a single
+    TCP/TLS connection; otherwise falls back to HTTP/1.1 keep-alive. Requires the optional
+    httpx dependency. Supports GET/POST/PUT/PATCH/DELETE.
+
+    All functions support the same arguments:
+    :param api_path: (str) The path along the base URL that will be the endpoint hit.
+    :param payload: (dict) The json payload or body for a request that needs it.
+    :param headers: (dict) Any required headers for the request.
+    :return: (httpx.Response) The raw response with all fields on successful request.
+    """
+    def __init__(self, base_url: str):
+        if httpx is None:
+            raise ImportError('HttpxRequestApi requires the optional httpx package.')
+        self.base_url = base_url
+        limits = httpx.Limits(max_keepalive_connections=20)
         try:
-            response.raise_for_status()
-            return response
-        except requests.HTTPError:
-            raise
+            self._client = httpx.Client(base_url=base_url, http2=True, timeout=10.0, limits=limits)
+        except ImportError:
+            # http2=True needs the 'h2' extra; keep-alive HTTP/1.1 still applies without it.
+            self._client = httpx.Client(base_url=base_url, timeout=10.0, limits=limits)
+
+    def close(self):
+        """
+        Closes the underlying client and its pooled connections.
+        """
+        self._client.close()
+
+    def __enter__(self):
+        return self
 
-    @retry(Exception, total_tries=2, logger=logger)
-    def patch(self, api_path: str, payload: dict = None, headers: dict = None) -> requests.models.Response:
-        response = requests.patch(f'{self.base_url}{api_path}', json=payload, headers=headers)
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @retry(HTTPX_TRANSIENT_EXCEPTIONS, total_tries=3, logger=logger)
+    def _request(self, method: str, api_path: str, payload: dict = None, headers: dict = None,
+                 data: bytes = None):
+        response = self._client.request(method, api_path, json=payload, content=data, headers=headers)
         try:
             response.raise_for_status()
-            return response
-        except requests.HTTPError:
+        except httpx.HTTPStatusError as err:
+            if response.status_code in TRANSIENT_STATUS_CODES:
+                transient = TransientHTTPError(str(err), response=response)
+                retry_after = response.headers.get('Retry-After')
+                if retry_after is not None:
+                    try:
+                        transient.retry_after = float(retry_after)
+                    except ValueError:
+                        pass
+                raise transient from None
             raise
+        return response
+
+    def get(self, api_path: str, payload: dict = None, headers: dict = None, data: bytes = None):
+        return self._request('GET', api_path, payload=payload, headers=headers, data=data)
+
+    def post(self, api_path: str, payload: dict = None, headers: dict = None, data: bytes = None):
+        return self._request('POST', api_path, payload=payload, headers=headers, data=data)
+
+    def put(self, api_path: str, payload: dict = None, headers: dict = None, data: bytes = None):
+        return self._request('PUT', api_path, payload=payload, headers=headers, data=data)
+
+    def patch(self, api_path: str, payload: dict = None, headers: dict = None, data: bytes = None):
+        return self._request('PATCH', api_path, payload=payload, headers=headers, data=data)
 
-    @retry(Exception, total_tries=2, logger=logger)
-    def delete(self, api_path: str, payload: dict = None, headers: dict = None) -> requests.models.Response:
-        response = requests.delete(f'{self.base_url}{api_path}', json=payload, headers=headers)
+    def delete(self, api_path: str, payload: dict = None, headers: dict = None, data: bytes = None):
+        return self._request('DELETE', api_path, payload=payload, headers=headers, data=data)
+
+
+class HttpxAsyncRequestApi:
+    """
+    Async variant of HttpxRequestApi backed by httpx.AsyncClient, for use alongside
+    AsyncRequestApi where HTTP/2 multiplexing is wanted. Returns decoded json bodies like
+    AsyncRequestApi. Requires the optional httpx dependency.
+    """
+    def __init__(self, base_url: str):
+        if httpx is None:
+            raise ImportError('HttpxAsyncRequestApi requires the optional httpx package.')
+        self.base_url = base_url
+        limits = httpx.Limits(max_keepalive_connections=20)
         try:
-            response.raise_for_status()
-            return response
-        except requests.HTTPError:
-            raise
+            self._client = httpx.AsyncClient(base_url=base_url, http2=True, timeout=10.0, limits=limits)
+        except ImportError:
+            self._client = httpx.AsyncClient(base_url=base_url, timeout=10.0, limits=limits)
+
+    async def close(self):
+        """
+        Closes the underlying client and its pooled connections.
+        """
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _request(self, method: str, api_path: str, payload: dict = None, headers: dict = None) -> dict:
+        response = await self._client.request(method, api_path, json=payload, headers=headers)
+        response.raise_for_status()
+        return response.json()
+
+    async def get(self, api_path: str, payload: dict = None, headers: dict = None) -> dict:
+        return await self._request('GET', api_path, payload=payload, headers=headers)
+
+    async def post(self, api_path: str, payload: dict = None, headers: dict = None) -> dict:
+        return await self._request('POST', api_path, payload=payload, headers=headers)
+
+    async def put(self, api_path: str, payload: dict = None, headers: dict = None) -> dict:
+        return await self._request('PUT', api_path, payload=payload, headers=headers)
+
+    async def patch(self, api_path: str, payload: dict = None, headers: dict = None) -> dict:
+        return await self._request('PATCH', api_path, payload=payload, headers=headers)
+
+    async def delete(self, api_path: str, payload: dict = None, headers: dict = None) -> dict:
+        return await self._request('DELETE', api_path, payload=payload, headers=headers)
 
 
 class JsonPlaceholderModifier:
     """
     JSONPlaceholder API Modifier. Can create/delete posts, and insert/find fields from these posts to show to the user.
+    Post lookups are served from an in-process TTL cache, so repeated reads of the same post
+    cost a dict hit instead of an HTTP round-trip.
     """
-    def __init__(self):
-        self.requester = RequestApi('http://jsonplaceholder.typicode.com')
+    POST_CACHE_TTL = 30
+    BASE_URL = 'http://jsonplaceholder.typicode.com'
+
+    def __init__(self, use_httpx: bool = False):
+        """
+        :param use_httpx: (bool) When True, back the requesters with httpx (HTTP/2 capable)
+        instead of requests/aiohttp. Requires the optional httpx package.
+        """
+        if use_httpx:
+            self.requester = HttpxRequestApi(self.BASE_URL)
+            self.async_requester = HttpxAsyncRequestApi(self.BASE_URL)
+        else:
+            self.requester = RequestApi(self.BASE_URL)
+            self.async_requester = AsyncRequestApi(self.BASE_URL)
+        self._posts_path = '/posts/'
+        self._cache = {}
+
+    def _get_post_json(self, post_number: str, ttl: float = POST_CACHE_TTL) -> dict:
+        """
+        Fetches a post's json, serving repeated lookups from the cache while fresh.
+        :param post_number: (str) The post number to fetch.
+        :param ttl: (float) How long (in seconds) a cached post stays fresh.
+        :return: Returns the post's json. Raises HTTPError on request failure.
+        """
+        cached = self._cache.get(post_number)
+        if cached is not None:
+            stamp, post = cached
+            if time.monotonic() - stamp < ttl:
+                return post
+        post = _response_json(self.requester.get(self._posts_path + post_number))
+        self._cache[post_number] = (time.monotonic(), post)
+        return post
 
     def get_post_field(self, post_number: str, field: str) -> str:
         """
@@ -114,12 +481,78 @@ class JsonPlaceholderModifier:
         :return: Returns the field if found otherwise None.
         """
         try:
-            post = self.requester.get(f'/posts/{post_number}')
-            return post.json()[field]
+            return self._get_post_json(post_number)[field]
+        except KeyError:
+            logger.error('Error, field: %s does not exist for post number: %s.', field, post_number)
+        except HTTP_ERRORS as err:
+            logger.error('Error, %s.', err)
+
+    async def async_get_post_field(self, post_number: str, field: str) -> str:
+        """
+        Async variant of get_post_field.
+        :param post_number: (str) The post number to find.
+        :param field: (str) The field to find in said post.
+        :return: Returns the field if found otherwise None.
+        """
+        try:
+            post = await self.async_requester.get(self._posts_path + post_number)
+            return post[field]
         except KeyError:
-            logger.error(f'Error, field: {field} does not exist for post number: {post_number}.')
-        except requests.HTTPError as err:
-            logger.error(f'Error, {err}.')
+            logger.error('Error, field: %s does not exist for post number: %s.', field, post_number)
+        except ASYNC_HTTP_ERRORS as err:
+            logger.error('Error, %s.', err)
+
+    async def bulk_get_post_fields(self, post_numbers: list, field: str) -> list:
+        """
+        Gets the same field from several posts, issuing the requests concurrently so the
+        total wall-clock cost is roughly one round-trip rather than one per post.
+        :param post_numbers: (list<str>) The post numbers to find.
+        :param field: (str) The field to find in each post.
+        :return: Returns a list of fields in post_numbers order, None for posts missing the field.
+        """
+        return list(await asyncio.gather(
+            *[self.async_get_post_field(post_number, field) for post_number in post_numbers]
+        ))
+
+    async def async_insert_new_field(self, post_number: str, field_key: str, field_value: str) -> dict:
+        """
+        Async variant of insert_new_field.
+        :param post_number: (str) The post number to find.
+        :param field_key: (str) The field name to insert.
+        :param field_value: (str) The field value to insert.
+        :return: Returns the full post with the additional field, or None if there is an error.
+        """
+        try:
+            post = dict(await self.async_requester.get(self._posts_path + post_number))
+        except ASYNC_HTTP_ERRORS as err:
+            logger.error('Error, %s.', err)
+        else:
+            post[field_key] = field_value
+            return post
+
+    async def async_create_new_post(self, body: dict) -> dict:
+        """
+        Async variant of create_new_post.
+        :param body: (str) The body of the post to be created
+        :return: The created post's json, or None on error.
+        """
+        try:
+            self._cache.clear()
+            return await self.async_requester.post('/posts', payload=body, headers=JSON_CONTENT_HEADERS)
+        except ASYNC_HTTP_ERRORS as err:
+            logger.error('Error, %s.', err)
+
+    async def async_delete_post(self, post_id: str) -> dict:
+        """
+        Async variant of delete_post.
+        :param post_id: (str) the post id to delete.
+        :return: The response json from the action, or None on error.
+        """
+        try:
+            self._cache.pop(post_id, None)
+            return await self.async_requester.delete(self._posts_path + post_id)
+        except ASYNC_HTTP_ERRORS as err:
+            logger.error('Error, %s.', err)
 
     def insert_new_field(self, post_number: str, field_key: str, field_value: str) -> dict:
         """
@@ -130,9 +563,9 @@ class JsonPlaceholderModifier:
         :return: Returns the full post with the additional field, or None if there is an error.
         """
         try:
-            post = self.requester.get(f'/posts/{post_number}').json()
-        except requests.HTTPError as err:
-            logger.error(f'Error, {err}.')
+            post = dict(self._get_post_json(post_number))
+        except HTTP_ERRORS as err:
+            logger.error('Error, %s.', err)
         else:
             post[field_key] = field_value
             return post
@@ -144,13 +577,14 @@ class JsonPlaceholderModifier:
         :return: The response from the action, or None on error.
         """
         try:
+            self._cache.clear()
             return self.requester.post(
                 '/posts',
-                payload=body,
-                headers={'Content-type': 'application/json; charset=UTF-8'}
+                data=_serialize_body(body),
+                headers=JSON_CONTENT_HEADERS
             )
-        except requests.HTTPError as err:
-            logger.error(f'Error, {err}.')
+        except HTTP_ERRORS as err:
+            logger.error('Error, %s.', err)
 
     def delete_post(self, post_id: str) -> requests.models.Response:
         """
@@ -159,22 +593,34 @@ class JsonPlaceholderModifier:
         :return: The response from the action, or None on error.
         """
         try:
-            return self.requester.delete(f'/posts/{post_id}')
-        except requests.HTTPError as err:
-            logger.error(f'Error, {err}.')
+            self._cache.pop(post_id, None)
+            return self.requester.delete(self._posts_path + post_id)
+        except HTTP_ERRORS as err:
+            logger.error('Error, %s.', err)
 
 
-if __name__ == '__main__':
+async def main():
     a = JsonPlaceholderModifier()
 
-    print(a.get_post_field('99', 'title'))
-    print(a.insert_new_field('100', 'time', datetime.now(timezone.utc).strftime("%m/%d/%Y %H:%M:%S")))
-    b = a.create_new_post({
-        'title': 'Security Interview Post',
-        'userId': 500,
-        'body': 'This is an insertion test with a known API'
-    })
-    resp_tuple = (b.json()['id'], b.status_code, b.headers.get('x-powered-by'))
-    print(f'id: {resp_tuple[0]}, resp_code: {resp_tuple[1]}, "x-Powered-By" header: {resp_tuple[2]}')
-    c = a.delete_post('101')
-    print((c.status_code, c.headers.get('x-content-type-options')))
+    # The four demo calls are independent, so fire them concurrently; total wall-clock
+    # cost is roughly one round-trip instead of four back-to-back ones.
+    async with a.async_requester:
+        title, inserted, created, deleted = await asyncio.gather(
+            a.async_get_post_field('99', 'title'),
+            a.async_insert_new_field('100', 'time', datetime.now(timezone.utc).strftime("%m/%d/%Y %H:%M:%S")),
+            a.async_create_new_post({
+                'title': 'Security Interview Post',
+                'userId': 500,
+                'body': 'This is an insertion test with a known API'
+            }),
+            a.async_delete_post('101'),
+            return_exceptions=True
+        )
+    print(title)
+    print(inserted)
+    print(f'created post id: {created["id"] if created else None}')
+    print(f'deleted post response: {deleted}')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
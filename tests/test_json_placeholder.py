@@ -1,9 +1,50 @@
+import asyncio
+import json
+import logging
+import random
 import unittest
 import pytest
 from unittest.mock import patch
 import requests
 
-from src.json_placeholder import RequestApi, JsonPlaceholderModifier
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from src.json_placeholder import retry, AsyncRequestApi, RequestApi, HttpxRequestApi, JsonPlaceholderModifier
+
+
+class TestRetry(unittest.TestCase):
+    @patch('src.json_placeholder.time.sleep')
+    def test_retry_full_jitter(self, mock_sleep):
+        calls = []
+
+        @retry(ValueError, total_tries=3, initial_wait=1, rng=random.Random(42), logger=logging.getLogger())
+        def always_fails():
+            calls.append(1)
+            raise ValueError('boom')
+
+        with pytest.raises(ValueError):
+            always_fails()
+        assert len(calls) == 3
+        # Full jitter sleeps uniform(0, delay) with delay doubling per try, so each sleep
+        # stays within its backoff window rather than landing on the exact schedule.
+        sleeps = [call.args[0] for call in mock_sleep.call_args_list]
+        assert len(sleeps) == 2
+        assert 0 <= sleeps[0] <= 1
+        assert 0 <= sleeps[1] <= 2
+
+    @patch('src.json_placeholder.time.sleep')
+    def test_retry_no_jitter_caps_delay(self, mock_sleep):
+        @retry(ValueError, total_tries=4, initial_wait=1, max_delay=2, jitter='none',
+               logger=logging.getLogger())
+        def always_fails():
+            raise ValueError('boom')
+
+        with pytest.raises(ValueError):
+            always_fails()
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [1, 2, 2]
 
 
 class TestRequestApi(unittest.TestCase):
@@ -13,16 +54,18 @@ class TestRequestApi(unittest.TestCase):
     def response(self, response_code, data):
         r = requests.Response()
         r.status_code = response_code
+        r._content = json.dumps(data).encode()
 
         def json_func():
             return data
         r.json = json_func
         return r
 
-    @patch('src.json_placeholder.requests.get')
+    @patch('src.json_placeholder.requests.Session.request')
     def test_get(self, mock_response):
         mock_response.return_value = self.response(200, {'title': 'test_get1'})
         resp = self.req_tst.get('/posts/1')
+        assert mock_response.call_args.args[0] == 'GET'
         assert resp.status_code == 200
         assert resp.json()['title'] == 'test_get1'
 
@@ -30,10 +73,38 @@ class TestRequestApi(unittest.TestCase):
             mock_response.side_effect = requests.HTTPError()
             self.req_tst.get('/failedpath')
 
-    @patch('src.json_placeholder.requests.post')
+    @patch('src.json_placeholder.time.sleep')
+    @patch('src.json_placeholder.requests.Session.request')
+    def test_get_retries_transient_errors(self, mock_response, mock_sleep):
+        mock_response.return_value = self.response(503, {})
+        with pytest.raises(requests.HTTPError):
+            self.req_tst.get('/flakypath')
+        assert mock_response.call_count == 3
+
+    @patch('src.json_placeholder.time.sleep')
+    @patch('src.json_placeholder.requests.Session.request')
+    def test_get_does_not_retry_client_errors(self, mock_response, mock_sleep):
+        mock_response.return_value = self.response(404, {})
+        with pytest.raises(requests.HTTPError):
+            self.req_tst.get('/missingpath')
+        assert mock_response.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch('src.json_placeholder.time.sleep')
+    @patch('src.json_placeholder.requests.Session.request')
+    def test_get_honors_retry_after(self, mock_response, mock_sleep):
+        throttled = self.response(429, {})
+        throttled.headers['Retry-After'] = '7'
+        mock_response.return_value = throttled
+        with pytest.raises(requests.HTTPError):
+            self.req_tst.get('/throttledpath')
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [7, 7]
+
+    @patch('src.json_placeholder.requests.Session.request')
     def test_post(self, mock_response):
         mock_response.return_value = self.response(200, {'title': 'test_post1'})
         resp = self.req_tst.post('/posts/1')
+        assert mock_response.call_args.args[0] == 'POST'
         assert resp.status_code == 200
         assert resp.json()['title'] == 'test_post1'
 
@@ -41,10 +112,11 @@ class TestRequestApi(unittest.TestCase):
             mock_response.side_effect = requests.HTTPError()
             self.req_tst.post('/failedpath')
 
-    @patch('src.json_placeholder.requests.put')
+    @patch('src.json_placeholder.requests.Session.request')
     def test_put(self, mock_response):
         mock_response.return_value = self.response(200, {'title': 'test_put1'})
         resp = self.req_tst.put('/posts/1')
+        assert mock_response.call_args.args[0] == 'PUT'
         assert resp.status_code == 200
         assert resp.json()['title'] == 'test_put1'
 
@@ -52,10 +124,11 @@ class TestRequestApi(unittest.TestCase):
             mock_response.side_effect = requests.HTTPError()
             self.req_tst.put('/failedpath')
 
-    @patch('src.json_placeholder.requests.patch')
+    @patch('src.json_placeholder.requests.Session.request')
     def test_patch(self, mock_response):
         mock_response.return_value = self.response(200, {'title': 'test_patch1'})
         resp = self.req_tst.patch('/posts/1')
+        assert mock_response.call_args.args[0] == 'PATCH'
         assert resp.status_code == 200
         assert resp.json()['title'] == 'test_patch1'
 
@@ -63,10 +136,11 @@ class TestRequestApi(unittest.TestCase):
             mock_response.side_effect = requests.HTTPError()
             self.req_tst.patch('/failedpath')
 
-    @patch('src.json_placeholder.requests.delete')
+    @patch('src.json_placeholder.requests.Session.request')
     def test_delete(self, mock_response):
         mock_response.return_value = self.response(200, {'title': 'test_delete1'})
         resp = self.req_tst.delete('/posts/1')
+        assert mock_response.call_args.args[0] == 'DELETE'
         assert resp.status_code == 200
         assert resp.json()['title'] == 'test_delete1'
 
@@ -75,6 +149,61 @@ class TestRequestApi(unittest.TestCase):
             self.req_tst.delete('/failedpath')
 
 
+class TestAsyncRequestApi(unittest.TestCase):
+    @patch('src.json_placeholder.AsyncRequestApi._request')
+    def test_get_single_flight(self, mock_request):
+        api = AsyncRequestApi('http://test')
+
+        async def slow_request(method, api_path, payload=None, headers=None):
+            await asyncio.sleep(0.01)
+            return {'title': 'test_title'}
+        mock_request.side_effect = slow_request
+
+        async def run():
+            return await asyncio.gather(
+                api.get('/posts/1'),
+                api.get('/posts/1'),
+                api.get('/posts/2')
+            )
+        results = asyncio.run(run())
+        # The two concurrent GETs for /posts/1 share one request; /posts/2 gets its own.
+        assert results == [{'title': 'test_title'}] * 3
+        assert mock_request.call_count == 2
+
+
+@unittest.skipIf(httpx is None, 'httpx not installed')
+class TestHttpxRequestApi(unittest.TestCase):
+    def setUp(self):
+        self.req_tst = HttpxRequestApi('http://test')
+
+    def response(self, response_code, data):
+        return httpx.Response(
+            response_code,
+            json=data,
+            request=httpx.Request('GET', 'http://test/posts/1')
+        )
+
+    @patch('src.json_placeholder.httpx.Client.request')
+    def test_get(self, mock_response):
+        mock_response.return_value = self.response(200, {'title': 'test_get1'})
+        resp = self.req_tst.get('/posts/1')
+        assert mock_response.call_args.args[0] == 'GET'
+        assert resp.status_code == 200
+        assert resp.json()['title'] == 'test_get1'
+
+        with pytest.raises(httpx.HTTPStatusError):
+            mock_response.return_value = self.response(404, {})
+            self.req_tst.get('/failedpath')
+
+    @patch('src.json_placeholder.time.sleep')
+    @patch('src.json_placeholder.httpx.Client.request')
+    def test_get_retries_transient_errors(self, mock_response, mock_sleep):
+        mock_response.return_value = self.response(503, {})
+        with pytest.raises(requests.HTTPError):
+            self.req_tst.get('/flakypath')
+        assert mock_response.call_count == 3
+
+
 class TestJsonPlaceholderModifier(unittest.TestCase):
     def setUp(self):
         self.json_mod_tst = JsonPlaceholderModifier()
@@ -82,6 +211,7 @@ class TestJsonPlaceholderModifier(unittest.TestCase):
     def response(self, response_code, data):
         r = requests.Response()
         r.status_code = response_code
+        r._content = json.dumps(data).encode()
 
         def json_func():
             return data
@@ -103,7 +233,20 @@ class TestJsonPlaceholderModifier(unittest.TestCase):
         assert not self.json_mod_tst.get_post_field('1', 'titles')
 
         mock_get_post.side_effect = requests.HTTPError()
-        assert not self.json_mod_tst.get_post_field('1', 'title')
+        assert not self.json_mod_tst.get_post_field('2', 'title')
+
+    @patch('src.json_placeholder.RequestApi.get')
+    def test_get_post_field_cached(self, mock_get_post):
+        mock_get_post.return_value = self.response(200, {'id': 1, 'title': 'test_title'})
+        assert self.json_mod_tst.get_post_field('1', 'title') == 'test_title'
+        assert self.json_mod_tst.get_post_field('1', 'title') == 'test_title'
+        assert mock_get_post.call_count == 1
+
+        # Deleting the post invalidates its cache entry, forcing a refetch.
+        with patch('src.json_placeholder.RequestApi.delete', return_value=self.response(200, {})):
+            self.json_mod_tst.delete_post('1')
+        assert self.json_mod_tst.get_post_field('1', 'title') == 'test_title'
+        assert mock_get_post.call_count == 2
 
     @patch('src.json_placeholder.RequestApi.get')
     def test_insert_new_field(self, mock_get_post):
@@ -127,7 +270,29 @@ class TestJsonPlaceholderModifier(unittest.TestCase):
             }
 
         mock_get_post.side_effect = requests.HTTPError()
-        assert not self.json_mod_tst.insert_new_field('1', 'new_field', 'new_value')
+        assert not self.json_mod_tst.insert_new_field('2', 'new_field', 'new_value')
+
+    @patch('src.json_placeholder.AsyncRequestApi.get')
+    def test_async_get_post_field(self, mock_get_post):
+        mock_get_post.return_value = {
+            'userId': 1,
+            'id': 1,
+            'title': 'test_title',
+            'body': 'test_body'
+        }
+        assert asyncio.run(self.json_mod_tst.async_get_post_field('1', 'title')) == 'test_title'
+        assert not asyncio.run(self.json_mod_tst.async_get_post_field('1', 'titles'))
+
+    @patch('src.json_placeholder.AsyncRequestApi.get')
+    def test_bulk_get_post_fields(self, mock_get_post):
+        mock_get_post.return_value = {
+            'userId': 1,
+            'id': 1,
+            'title': 'test_title',
+            'body': 'test_body'
+        }
+        resp = asyncio.run(self.json_mod_tst.bulk_get_post_fields(['1', '2', '3'], 'title'))
+        assert resp == ['test_title', 'test_title', 'test_title']
 
     @patch('src.json_placeholder.RequestApi.post')
     def test_create_new_post(self, mock_post):
@@ -139,6 +304,8 @@ class TestJsonPlaceholderModifier(unittest.TestCase):
         }
         mock_post.return_value = self.response(200, test_body)
         assert self.json_mod_tst.create_new_post(test_body).json() == test_body
+        # The body goes out pre-serialized as json bytes rather than re-encoded per call.
+        assert json.loads(mock_post.call_args.kwargs['data']) == test_body
 
         mock_post.side_effect = requests.HTTPError()
         assert not self.json_mod_tst.create_new_post({})